@@ -1,35 +1,361 @@
 import re
-from flask import Flask, request, render_template, jsonify, send_from_directory
+from flask import Flask, request, render_template, jsonify, send_file, send_from_directory
 import os
 import zipfile
+import io
+import mmap
 import tempfile
 import shutil
-from pathlib import Path
 import json
+import hashlib
+import uuid
+from collections import OrderedDict, namedtuple
 import time
 from datetime import datetime
 import openai
+try:
+    import hyperscan  # Optional: multi-pattern DFA scanning of source files
+except ImportError:
+    hyperscan = None
+try:
+    import orjson  # Optional: much faster encoding of large reports
+except ImportError:
+    orjson = None
+try:
+    import brotli  # Optional: precompressed copy of the index page
+except ImportError:
+    brotli = None
 from werkzeug.utils import secure_filename
+from urllib.parse import unquote
+from jinja2 import Environment
 import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import queue
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
+app.config['MAX_UNCOMPRESSED_SIZE'] = 1024 * 1024 * 1024  # 1GB max analyzed size of a ZIP's contents
 app.config['UPLOAD_FOLDER'] = 'uploads'
+app.config['CHUNK_FOLDER'] = os.path.join('uploads', 'chunks')
+app.config['UPLOAD_CHUNK_SIZE'] = 8 * 1024 * 1024  # Largest slice of a chunked upload, as sent by the page
+app.config['CHUNK_UPLOAD_TTL'] = 60 * 60  # Seconds an unfinished chunked upload is kept
 app.config['REPORTS_FOLDER'] = 'reports'
 
 # Ensure directories exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+os.makedirs(app.config['CHUNK_FOLDER'], exist_ok=True)
 os.makedirs(app.config['REPORTS_FOLDER'], exist_ok=True)
 os.makedirs('templates', exist_ok=True)
 os.makedirs('static', exist_ok=True)
 
 # OpenAI Configuration
 openai.api_key = os.getenv('OPENAI_API_KEY')
+openai.max_retries = 5  # SDK retries 429/5xx/timeouts with exponential backoff
+
+# Migration step categories, in report order, with the instructions for each
+MIGRATION_STEP_PROMPTS = {
+    "environment_setup": """
+    Based on the project type and framework version from your code_analysis, provide detailed environment setup steps:
+    1. Installing required SDKs and tools
+    2. Setting up development environment
+    3. Configuring cloud platform tools
+    4. Installing migration utilities
+    
+    Include exact commands, download links, and version requirements.
+    """,
+    
+    "code_analysis_and_inventory": """
+    Provide detailed steps for analyzing the legacy codebase:
+    1. Using .NET Portability Analyzer - exact steps with screenshots
+    2. Running try-convert tool - command line examples
+    3. Dependency analysis tools - which tools to use and how
+    4. Creating migration inventory spreadsheet
+    
+    Include specific commands, tool configurations, and expected outputs.
+    """,
+    
+    "dependency_migration": """
+    For each dependency identified in your code_analysis provide:
+    1. Exact NuGet commands to remove old packages
+    2. Exact commands to install new packages
+    3. Code changes required
+    4. Testing steps to verify migration
+    
+    Include version compatibility matrices and breaking changes.
+    """,
+    
+    "configuration_migration": """
+    Provide step-by-step configuration migration:
+    1. Converting web.config/app.config to appsettings.json
+    2. Migrating connection strings
+    3. Setting up dependency injection
+    4. Environment-specific configurations
+    
+    Include before/after code examples and exact transformation steps.
+    """,
+    
+    "database_migration": """
+    Provide database migration strategy:
+    1. Assessing current database compatibility
+    2. Planning migration approach (lift-and-shift vs modernization)
+    3. Data migration tools and steps
+    4. Connection string updates
+    5. Cloud database configuration
+    
+    Include specific Azure SQL/AWS RDS setup steps.
+    """,
+    
+    "testing_strategy": """
+    Provide comprehensive testing approach:
+    1. Setting up automated testing framework
+    2. Creating migration test cases
+    3. Performance testing strategy
+    4. Security testing requirements
+    5. User acceptance testing plan
+    
+    Include test framework setup commands and sample test cases.
+    """,
+    
+    "deployment_preparation": """
+    Provide cloud deployment preparation steps:
+    1. Containerization with Docker
+    2. CI/CD pipeline setup
+    3. Infrastructure as Code templates
+    4. Monitoring and logging configuration
+    5. Security configuration
+    
+    Include exact Azure DevOps/GitHub Actions configurations.
+    """,
+    
+    "post_migration_tasks": """
+    Provide post-migration checklist:
+    1. Performance optimization steps
+    2. Security hardening
+    3. Monitoring setup validation
+    4. Documentation updates
+    5. Team training requirements
+    
+    Include verification scripts and monitoring dashboards setup.
+    """
+}
+
+# Directories and build artifacts that are never useful to the analysis
+IGNORED_DIRS = frozenset({'bin', 'obj', 'packages', 'node_modules', '.git', '.vs', 'testresults'})
+IGNORED_PREFIX = '.'
+IGNORED_FILE_EXTENSIONS = ('.dll', '.pdb', '.exe', '.cache', '.nupkg')
+
+def _is_ignored_member(filename):
+    """Whether a zip member lies under an ignored/hidden directory or is a skipped artifact"""
+    is_dir = filename.endswith('/')
+    parts = filename.rstrip('/').lower().split('/')
+    dirs = parts if is_dir else parts[:-1]
+    if any(part in IGNORED_DIRS or part.startswith(IGNORED_PREFIX) for part in dirs):
+        return True
+    if is_dir:
+        return False
+    name = parts[-1]
+    return name.startswith(IGNORED_PREFIX) or name.endswith(IGNORED_FILE_EXTENSIONS)
+
+# File categories by lower-cased extension, with a few well-known file names taking precedence
+EXT_CATEGORY = {
+    **dict.fromkeys(['.cs', '.vb', '.aspx', '.ascx', '.ashx'], 'source_code'),
+    **dict.fromkeys(['.csproj', '.vbproj', '.sln', '.proj'], 'project_files'),
+    **dict.fromkeys(['.md', '.txt', '.doc', '.docx'], 'documentation'),
+    **dict.fromkeys(['.css', '.js', '.html', '.htm', '.jpg', '.png', '.gif'], 'resources')
+}
+NAME_CATEGORY = dict.fromkeys(['web.config', 'app.config', 'appsettings.json', 'packages.config'], 'configuration')
+
+# XML documentation (///), single-line (//) and multi-line (/* */) comments
+_COMMENT_RE = re.compile(rb"///[ \t]*(?P<xml>[^\r\n]+)|//[ \t]*(?P<line>[^\r\n]+)|/\*(?P<block>.*?)\*/", re.DOTALL)
+COMMENT_SCAN_BYTES = 256 * 1024  # Comments are only looked for near the top of each file
+
+if hyperscan is not None:
+    # Comment openers compiled into one DFA; comment bodies are sliced out around each match
+    _LINE_MARKER, _BLOCK_MARKER = 0, 1
+    _COMMENT_MARKER_DB = hyperscan.Database()
+    _COMMENT_MARKER_DB.compile(
+        expressions=[rb'//', rb'/\*'],
+        ids=[_LINE_MARKER, _BLOCK_MARKER],
+        elements=2,
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 2
+    )
+    # The database's default scratch space may only be used by one scan at a time
+    _COMMENT_MARKER_LOCK = threading.Lock()
+
+def _scan_comments(buf, limit=20):
+    """Return up to `limit` comments from the start of a bytes-like buffer, in source order"""
+    if hyperscan is not None:
+        return _scan_comments_hyperscan(buf, limit)
+    
+    comments = []
+    for match in _COMMENT_RE.finditer(buf, 0, COMMENT_SCAN_BYTES):
+        comment = match.group(match.lastgroup).strip()
+        if comment:
+            comments.append(comment.decode('utf-8', 'ignore'))
+            if len(comments) == limit:
+                break
+    return comments
+
+def _scan_comments_hyperscan(buf, limit):
+    """Hyperscan version of _scan_comments, producing the same comments as _COMMENT_RE"""
+    data = bytes(buf[:COMMENT_SCAN_BYTES])
+    comments = []
+    consumed = 0  # End of the last comment taken; markers inside it are ignored
+    
+    def on_match(marker, start, end, flags, context):
+        nonlocal consumed
+        if start < consumed:
+            return False
+        
+        if marker == _LINE_MARKER:
+            if data[end:end + 1] == b'/' and data[end + 1:end + 2] not in (b'', b'\r', b'\n'):
+                end += 1  # XML documentation comment (///); a bare /// is a // comment of '/'
+            line_end = data.find(b'\n', end)
+            if line_end < 0:
+                line_end = len(data)
+            carriage_return = data.find(b'\r', end, line_end)
+            if carriage_return >= 0:
+                line_end = carriage_return
+            comment = data[end:line_end]
+            consumed = line_end
+        else:
+            close = data.find(b'*/', end)
+            if close < 0:
+                return False  # Unterminated block comment
+            comment = data[end:close]
+            consumed = close + 2
+        
+        comment = comment.strip()
+        if comment:
+            comments.append(comment.decode('utf-8', 'ignore'))
+        return len(comments) == limit  # True stops the scan
+    
+    with _COMMENT_MARKER_LOCK:
+        try:
+            _COMMENT_MARKER_DB.scan(data, match_event_handler=on_match)
+        except hyperscan.error:
+            if len(comments) < limit:
+                raise  # Only the deliberate stop above is expected
+    return comments
+
+def _string_list():
+    return {'type': 'array', 'items': {'type': 'string'}}
+
+NOT_DOTNET_MESSAGE = "Not a .NET project: no .NET source code or project files were found, so AI analysis was skipped."
+
+# Structured Outputs schema for the code_analysis section
+CODE_ANALYSIS_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'project_type': {'type': 'string'},
+        'framework_version': {'type': 'string'},
+        'dependencies': _string_list(),
+        'architecture_patterns': _string_list(),
+        'migration_challenges': _string_list(),
+        'security_concerns': _string_list(),
+        'performance_considerations': _string_list()
+    },
+    'required': [
+        'project_type', 'framework_version', 'dependencies', 'architecture_patterns',
+        'migration_challenges', 'security_concerns', 'performance_considerations'
+    ],
+    'additionalProperties': False
+}
+
+# Schema of the single batched response: code analysis first, so the later sections can build on it
+MIGRATION_ANALYSIS_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'code_analysis': CODE_ANALYSIS_SCHEMA,
+        'executive_summary': {'type': 'string'},
+        **{category: {'type': 'string'} for category in MIGRATION_STEP_PROMPTS}
+    },
+    'required': ['code_analysis', 'executive_summary', *MIGRATION_STEP_PROMPTS],
+    'additionalProperties': False
+}
+
+def _status_path(report_id):
+    """Path of the small JSON file holding an analysis' progress and status"""
+    return os.path.join(app.config['REPORTS_FOLDER'], f'{report_id}.status.json')
+
+def _write_status_file(report_id, progress, status):
+    """Atomically replace an analysis' status file, so readers never see a partial write"""
+    status_path = _status_path(report_id)
+    tmp_path = f'{status_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'progress': progress,
+            'status': status,
+            'completed': progress >= 100
+        }, f)
+    os.replace(tmp_path, status_path)
+
+_ZipStat = namedtuple('_ZipStat', 'st_size')
+
+class _ZipEntry:
+    """DirEntry look-alike for a member (or implied directory) of a zip archive"""
+    def __init__(self, name, path, is_dir, size):
+        self.name = name
+        self.path = path
+        self._is_dir = is_dir
+        self._size = size
+
+    def is_dir(self, follow_symlinks=True):
+        return self._is_dir
+
+    def is_file(self, follow_symlinks=True):
+        return not self._is_dir
+
+    def stat(self, follow_symlinks=True):
+        return _ZipStat(self._size)
+
+class ZipBackedProject:
+    """Uploaded zip archive exposing the same scandir/open surface as a project directory"""
+    def __init__(self, zip_file):
+        self.zip_file = zip_file
+        # Directory listings, keyed by '/'-separated relative path, built from infolist() alone
+        self._children = {'': []}
+        for info in zip_file.infolist():
+            name = info.filename.rstrip('/')
+            if not name or _is_ignored_member(info.filename):
+                continue
+            if info.is_dir():
+                self._add_dir(name)
+            else:
+                parent, _, base = name.rpartition('/')
+                self._add_dir(parent)
+                self._children[parent].append(_ZipEntry(base, name, False, info.file_size))
+
+    def _add_dir(self, path):
+        """Register a directory and any parents the archive only implies"""
+        missing = []
+        while path not in self._children:
+            missing.append(path)
+            path = path.rpartition('/')[0]
+        for path in reversed(missing):
+            parent, _, base = path.rpartition('/')
+            self._children[parent].append(_ZipEntry(base, path, True, 0))
+            self._children[path] = []
+
+    def scandir(self, rel_dir):
+        """List the entries directly inside a directory of the archive"""
+        return self._children.get(rel_dir.replace(os.sep, '/'), [])
+
+    def open(self, rel_path):
+        """Open an archive member for binary reading"""
+        return self.zip_file.open(rel_path.replace(os.sep, '/'))
 
 class DotNetMigrationAnalyzer:
-    def __init__(self, project_path, report_id):
-        self.project_path = project_path
+    def __init__(self, project, report_id):
+        """project is either a directory path or an open zipfile.ZipFile"""
+        if isinstance(project, zipfile.ZipFile):
+            self.zip_project = ZipBackedProject(project)
+            self.project_path = project.filename
+        else:
+            self.zip_project = None
+            self.project_path = project
         self.report_id = report_id
         self.analysis_data = {
             'files_and_folders': {},
@@ -41,8 +367,36 @@ class DotNetMigrationAnalyzer:
             'configuration_files': {},
             'code_analysis': {}
         }
-        self.progress = 0
-        self.status = "Starting analysis..."
+        self._progress = 0
+        self._status = "Starting analysis..."
+        self._write_status()
+        # Filled in by the single crawl_project walk and consumed by the later steps
+        self._files_by_type = {}
+        self._folders = []
+        self._readme_paths = []
+        self._structure_summary_json = None
+
+    @property
+    def progress(self):
+        return self._progress
+
+    @progress.setter
+    def progress(self, value):
+        self._progress = value
+        self._write_status()
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+        self._write_status()
+
+    def _write_status(self):
+        """Persist progress to reports/<report_id>.status.json for the /progress endpoint"""
+        _write_status_file(self.report_id, self._progress, self._status)
 
     def analyze_project(self):
         """Main analysis pipeline"""
@@ -55,23 +409,22 @@ class DotNetMigrationAnalyzer:
             self.progress = 20
             self.list_files_and_folders()
             
-            self.status = "Step 3: Extracting README and comments..."
-            self.progress = 30
-            self.extract_readme_and_comments()
+            # Don't spend OpenAI requests on uploads that contain no .NET code at all
+            files_by_type = self.analysis_data['files_and_folders']['files_by_type']
+            is_dotnet = bool(files_by_type['project_files']) or bool(files_by_type['source_code'])
             
-            self.status = "Step 4: Analyzing codebase with AI..."
-            self.progress = 40
-            self.analyze_codebase_with_ai()
-            
-            self.status = "Step 5: Generating executive summary..."
-            self.progress = 60
-            self.generate_executive_summary()
-            
-            self.status = "Step 6: Creating detailed migration steps..."
-            self.progress = 80
-            self.generate_migration_steps()
+            if is_dotnet:
+                self.status = "Step 3: Extracting README and comments..."
+                self.progress = 30
+                self.extract_readme_and_comments()
+                
+                self.status = "Step 4: Analyzing codebase and creating migration steps with AI..."
+                self.progress = 40
+                self.analyze_codebase_with_ai()
+            else:
+                self._skip_ai_analysis(NOT_DOTNET_MESSAGE)
             
-            self.status = "Step 7: Generating final report..."
+            self.status = "Step 5: Generating final report..."
             self.progress = 90
             self.generate_final_report()
             
@@ -83,38 +436,21 @@ class DotNetMigrationAnalyzer:
             self.status = f"Error: {str(e)}"
             return False
 
-    def crawl_project(self):
-        """Crawl the project directory and catalog all files"""
-        self.analysis_data['project_structure'] = self._build_directory_tree(self.project_path)
-
-    def _build_directory_tree(self, path, max_depth=5, current_depth=0):
-        """Build a nested dictionary representing the directory structure"""
-        if current_depth > max_depth:
-            return {}
-        
-        tree = {}
-        try:
-            for item in Path(path).iterdir():
-                if item.name.startswith('.'):
-                    continue
-                    
-                if item.is_file():
-                    tree[item.name] = {
-                        'type': 'file',
-                        'size': item.stat().st_size,
-                        'extension': item.suffix.lower()
-                    }
-                elif item.is_dir():
-                    tree[item.name] = {
-                        'type': 'directory',
-                        'children': self._build_directory_tree(item, max_depth, current_depth + 1)
-                    }
-        except PermissionError:
-            pass
-        return tree
+    def _skip_ai_analysis(self, message):
+        """Fill the AI-generated sections with a static explanation instead of calling OpenAI"""
+        self.analysis_data['readme_and_comments'] = {
+            'readme_files': [],
+            'code_comments': []
+        }
+        self.analysis_data['code_analysis'] = {'error': message}
+        self.analysis_data['executive_summary'] = message
+        self.analysis_data['migration_steps'] = {
+            category: self._category_steps(category, message)
+            for category in MIGRATION_STEP_PROMPTS
+        }
 
-    def list_files_and_folders(self):
-        """Create comprehensive lists of files and folders with categorization"""
+    def crawl_project(self):
+        """Walk the project once, building the directory tree, file catalog and README list together"""
         files_by_type = {
             'source_code': [],
             'project_files': [],
@@ -123,44 +459,113 @@ class DotNetMigrationAnalyzer:
             'resources': [],
             'other': []
         }
-        
         folders = []
+        readme_paths = []
         
-        for root, dirs, files in os.walk(self.project_path):
-            # Skip hidden and common ignored directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d.lower() not in ['bin', 'obj', 'packages', 'node_modules']]
+        tree = {}
+        # Children dict of every directory visited so far, keyed by relative path
+        tree_nodes = {'': tree}
+        
+        for rel_path, entry, depth, is_dir in self._walk_once():
+            file = entry.name
+            # Directories are yielded before their contents, so the parent is always known
+            parent = tree_nodes[os.path.dirname(rel_path)]
             
-            rel_root = os.path.relpath(root, self.project_path)
-            if rel_root != '.':
-                folders.append(rel_root)
+            if is_dir:
+                folders.append(rel_path)
+                children = {}
+                parent[file] = {
+                    'type': 'directory',
+                    'children': children
+                }
+                tree_nodes[rel_path] = children
+                continue
             
-            for file in files:
-                if file.startswith('.'):
+            # Derive the lower-cased name and extension once; both feed the tree and the catalog
+            name_lower = file.lower()
+            dot = name_lower.rfind('.')
+            file_ext = name_lower[dot:] if dot > 0 else ''
+            size = entry.stat(follow_symlinks=False).st_size
+            
+            parent[file] = {
+                'type': 'file',
+                'size': size,
+                'extension': file_ext
+            }
+            
+            file_info = {
+                'name': file,
+                'path': rel_path,
+                'size': size,
+                'extension': file_ext
+            }
+            
+            # Categorize files
+            category = NAME_CATEGORY.get(name_lower) or EXT_CATEGORY.get(file_ext, 'other')
+            if category in ('resources', 'other') and 'readme' in name_lower:
+                category = 'documentation'
+            files_by_type[category].append(file_info)
+            
+            # Remember README candidates so they can be read without another walk
+            if 'readme' in name_lower or name_lower.endswith('.md'):
+                readme_paths.append(rel_path)
+        
+        self.analysis_data['project_structure'] = tree
+        self._files_by_type = files_by_type
+        self._folders = folders
+        self._readme_paths = readme_paths
+
+    def _walk_once(self):
+        """Yield (rel_path, entry, depth, is_dir) for every visible entry, scanning each directory once"""
+        # Explicit depth-first stack; folders are yielded when visited, matching os.walk order
+        pending = [('', None, -1)]
+        while pending:
+            rel_root, dir_entry, depth = pending.pop()
+            if dir_entry is not None:
+                yield rel_root, dir_entry, depth, True
+            
+            subdirs = []
+            try:
+                entries = self._scandir(rel_root)
+            except PermissionError:
+                entries = []
+            
+            for entry in entries:
+                name_lower = entry.name.lower()
+                # Skip hidden files and directories
+                if name_lower.startswith(IGNORED_PREFIX):
                     continue
-                    
-                file_path = os.path.join(rel_root, file) if rel_root != '.' else file
-                file_ext = Path(file).suffix.lower()
                 
-                file_info = {
-                    'name': file,
-                    'path': file_path,
-                    'size': os.path.getsize(os.path.join(root, file)),
-                    'extension': file_ext
-                }
-                
-                # Categorize files
-                if file_ext in ['.cs', '.vb', '.aspx', '.ascx', '.ashx']:
-                    files_by_type['source_code'].append(file_info)
-                elif file_ext in ['.csproj', '.vbproj', '.sln', '.proj']:
-                    files_by_type['project_files'].append(file_info)
-                elif file.lower() in ['web.config', 'app.config', 'appsettings.json', 'packages.config']:
-                    files_by_type['configuration'].append(file_info)
-                elif file_ext in ['.md', '.txt', '.doc', '.docx'] or 'readme' in file.lower():
-                    files_by_type['documentation'].append(file_info)
-                elif file_ext in ['.css', '.js', '.html', '.htm', '.jpg', '.png', '.gif']:
-                    files_by_type['resources'].append(file_info)
-                else:
-                    files_by_type['other'].append(file_info)
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune ignored directories before descending into them
+                    if name_lower not in IGNORED_DIRS:
+                        rel_path = os.path.join(rel_root, entry.name) if rel_root else entry.name
+                        subdirs.append((rel_path, entry, depth + 1))
+                elif entry.is_file(follow_symlinks=False):
+                    if not name_lower.endswith(IGNORED_FILE_EXTENSIONS):
+                        rel_path = os.path.join(rel_root, entry.name) if rel_root else entry.name
+                        yield rel_path, entry, depth + 1, False
+            
+            # Push in reverse so folders are visited in directory order
+            pending.extend(reversed(subdirs))
+
+    def _scandir(self, rel_root):
+        """List a project directory from the filesystem or the zip archive"""
+        if self.zip_project is not None:
+            return self.zip_project.scandir(rel_root)
+        with os.scandir(os.path.join(self.project_path, rel_root)) as entries:
+            return list(entries)
+
+    def _open(self, rel_path):
+        """Open a project file for binary reading from the filesystem or the zip archive"""
+        if self.zip_project is not None:
+            return self.zip_project.open(rel_path)
+        return open(os.path.join(self.project_path, rel_path), 'rb')
+
+    def list_files_and_folders(self):
+        """Create comprehensive lists of files and folders with categorization"""
+        files_by_type = self._files_by_type
+        folders = self._folders
         
         self.analysis_data['files_and_folders'] = {
             'files_by_type': files_by_type,
@@ -171,112 +576,134 @@ class DotNetMigrationAnalyzer:
 
     def extract_readme_and_comments(self):
         """Extract README files and code comments"""
-        readme_content = []
-        comments_summary = []
-        
-        # Find and read README files
-        for root, dirs, files in os.walk(self.project_path):
-            for file in files:
-                if 'readme' in file.lower() or file.lower().endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()[:2000]  # Limit content
-                            readme_content.append({
-                                'file': file,
-                                'path': os.path.relpath(file_path, self.project_path),
-                                'content': content
-                            })
-                    except:
-                        pass
-        
-        # Extract comments from source files
         source_files = self.analysis_data['files_and_folders']['files_by_type']['source_code'][:20]  # Limit to first 20 files
-        for file_info in source_files:
-            file_path = os.path.join(self.project_path, file_info['path'])
-            comments = self._extract_comments_from_file(file_path)
-            if comments:
-                comments_summary.append({
-                    'file': file_info['name'],
-                    'comments': comments[:10]  # Limit comments per file
-                })
+        
+        # Each file is read independently, so overlap the disk reads on a small thread pool
+        workers = min(8, max(1, len(self._readme_paths) + len(source_files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            readme_results = executor.map(self._read_readme, self._readme_paths)
+            comment_results = executor.map(self._extract_comments_from_file_with_meta, source_files)
+            readme_content = [readme for readme in readme_results if readme]
+            comments_summary = [summary for summary in comment_results if summary]
         
         self.analysis_data['readme_and_comments'] = {
             'readme_files': readme_content,
             'code_comments': comments_summary
         }
 
-    def _extract_comments_from_file(self, file_path):
+    def _read_readme(self, rel_path):
+        """Read the start of a README file found while crawling"""
+        try:
+            with io.TextIOWrapper(self._open(rel_path), encoding='utf-8', errors='ignore') as f:
+                content = f.read(2000)  # Limit content
+        except:
+            return None
+        return {
+            'file': os.path.basename(rel_path),
+            'path': rel_path,
+            'content': content
+        }
+
+    def _extract_comments_from_file_with_meta(self, file_info):
+        """Extract the comments of a cataloged source file, or None if it has none"""
+        comments = self._extract_comments_from_file(file_info['path'])
+        if not comments:
+            return None
+        return {
+            'file': file_info['name'],
+            'comments': comments[:10]  # Limit comments per file
+        }
+
+    def _extract_comments_from_file(self, rel_path):
         """Extract comments from a source code file"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Extract single-line and multi-line comments
-            comments = []
-            
-            # Single-line comments (//)
-            single_line_pattern = r'//\s*(.+)'
-            single_comments = re.findall(single_line_pattern, content)
-            comments.extend([c.strip() for c in single_comments if c.strip()])
-            
-            # Multi-line comments (/* */)
-            multi_line_pattern = r'/\*(.*?)\*/'
-            multi_comments = re.findall(multi_line_pattern, content, re.DOTALL)
-            comments.extend([c.strip() for c in multi_comments if c.strip()])
-            
-            # XML documentation comments (///)
-            xml_doc_pattern = r'///\s*(.+)'
-            xml_comments = re.findall(xml_doc_pattern, content)
-            comments.extend([c.strip() for c in xml_comments if c.strip()])
-            
-            return comments[:20]  # Limit to 20 comments per file
+            with self._open(rel_path) as f:
+                if self.zip_project is not None:
+                    # Archive members cannot be mapped; read just the scanned prefix
+                    return _scan_comments(f.read(COMMENT_SCAN_BYTES))
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []  # mmap cannot map an empty file
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    return _scan_comments(mm)
+                finally:
+                    mm.close()
         except:
             return []
 
     def analyze_codebase_with_ai(self):
-        """Use OpenAI to analyze the codebase structure and dependencies"""
-        # Prepare analysis prompt
-        structure_summary = self._prepare_structure_summary()
+        """Use a single OpenAI request to produce the code analysis, executive summary and migration steps"""
+        sections = "\n\n".join(
+            f"{category}:\n{prompt.strip()}" for category, prompt in MIGRATION_STEP_PROMPTS.items()
+        )
         
         prompt = f"""
-        Analyze this .NET codebase structure and provide insights:
+        Analyze this .NET legacy codebase for cloud migration.
 
         PROJECT STRUCTURE:
-        {json.dumps(structure_summary, indent=2)}
-
-        Please analyze and provide:
-        1. Project type identification (Web Forms, MVC, Web API, Console, etc.)
-        2. .NET Framework version detection
-        3. Key dependencies and technologies used
-        4. Architecture patterns identified
-        5. Potential migration challenges
-        6. Security concerns
-        7. Performance considerations
-
-        Respond in JSON format with these sections.
+        {self.structure_summary_json}
+
+        README CONTENT:
+        {json.dumps(self.analysis_data['readme_and_comments']['readme_files'][:2], indent=2)}
+
+        Respond with a single JSON object containing these sections:
+
+        code_analysis:
+        1. project_type: Project type identification (Web Forms, MVC, Web API, Console, etc.)
+        2. framework_version: .NET Framework version detection
+        3. dependencies: Key dependencies and technologies used
+        4. architecture_patterns: Architecture patterns identified
+        5. migration_challenges: Potential migration challenges
+        6. security_concerns: Security concerns
+        7. performance_considerations: Performance considerations
+
+        executive_summary:
+        A 3-paragraph executive summary, based on the project structure and your code_analysis, covering:
+        1. Current state of the application
+        2. Key technical challenges for migration
+        3. Recommended migration approach and timeline estimate
+
+        {sections}
         """
         
         try:
             response = openai.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are a senior .NET architect specializing in legacy code migration to cloud platforms."},
+                    {"role": "system", "content": "You are a senior .NET architect and migration specialist. Provide detailed, actionable steps with exact commands and configurations."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=2000,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {"name": "migration_analysis", "strict": True, "schema": MIGRATION_ANALYSIS_SCHEMA}
+                },
+                max_tokens=2000 + 800 + 1500 * len(MIGRATION_STEP_PROMPTS),
                 temperature=0.3
             )
             
-            ai_analysis = response.choices[0].message.content
-            # Try to parse as JSON, fall back to text if needed
-            try:
-                self.analysis_data['code_analysis'] = json.loads(ai_analysis)
-            except:
-                self.analysis_data['code_analysis'] = {'raw_analysis': ai_analysis}
-                
+            # Structured Outputs guarantees the response conforms to the schema
+            result = json.loads(response.choices[0].message.content)
+            
+            self.analysis_data['code_analysis'] = result['code_analysis']
+            self.analysis_data['executive_summary'] = result['executive_summary']
+            self.analysis_data['migration_steps'] = {
+                category: self._category_steps(category, result[category])
+                for category in MIGRATION_STEP_PROMPTS
+            }
         except Exception as e:
             self.analysis_data['code_analysis'] = {'error': str(e)}
+            self.analysis_data['executive_summary'] = f"Error generating summary: {str(e)}"
+            self.analysis_data['migration_steps'] = {
+                category: self._category_steps(category, f"Error generating steps: {str(e)}")
+                for category in MIGRATION_STEP_PROMPTS
+            }
+
+    @property
+    def structure_summary_json(self):
+        """Compact JSON of the structure summary, serialized once and reused by every prompt"""
+        if self._structure_summary_json is None:
+            self._structure_summary_json = json.dumps(self._prepare_structure_summary(), separators=(',', ':'))
+        return self._structure_summary_json
 
     def _prepare_structure_summary(self):
         """Prepare a concise summary of project structure for AI analysis"""
@@ -293,195 +720,21 @@ class DotNetMigrationAnalyzer:
             summary['file_types'][file_type] = len(files)
             if file_type in ['project_files', 'configuration']:
                 summary['key_files'].extend([f['name'] for f in files[:10]])
+        del summary['key_files'][10:]
         
         # Add sample of source files
-        source_files = self.analysis_data['files_and_folders']['files_by_type']['source_code'][:20]
+        source_files = self.analysis_data['files_and_folders']['files_by_type']['source_code'][:10]
         summary['source_files_sample'] = [f['name'] for f in source_files]
         
         return summary
 
-    def generate_executive_summary(self):
-        """Generate executive summary using AI"""
-        analysis_data = self.analysis_data
-        
-        prompt = f"""
-        Create an executive summary for this .NET legacy codebase migration analysis:
-
-        PROJECT OVERVIEW:
-        - Total files: {analysis_data['files_and_folders']['total_files']}
-        - Source code files: {len(analysis_data['files_and_folders']['files_by_type']['source_code'])}
-        - Project files: {len(analysis_data['files_and_folders']['files_by_type']['project_files'])}
-
-        AI ANALYSIS:
-        {json.dumps(analysis_data.get('code_analysis', {}), indent=2)}
-
-        README CONTENT:
-        {json.dumps(analysis_data['readme_and_comments']['readme_files'][:2], indent=2)}
-
-        Create a 3-paragraph executive summary covering:
-        1. Current state of the application
-        2. Key technical challenges for migration
-        3. Recommended migration approach and timeline estimate
-        """
-        
-        try:
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a senior technical consultant specializing in .NET modernization projects."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=800,
-                temperature=0.4
-            )
-            
-            self.analysis_data['executive_summary'] = response.choices[0].message.content
-        except Exception as e:
-            self.analysis_data['executive_summary'] = f"Error generating summary: {str(e)}"
-
-    def generate_migration_steps(self):
-        """Generate detailed migration steps using AI"""
-        categories = [
-            "environment_setup",
-            "code_analysis_and_inventory", 
-            "dependency_migration",
-            "configuration_migration",
-            "database_migration",
-            "testing_strategy",
-            "deployment_preparation",
-            "post_migration_tasks"
-        ]
-        
-        migration_steps = {}
-        
-        for category in categories:
-            self.progress += 2  # Increment progress for each category
-            migration_steps[category] = self._generate_category_steps(category)
-            time.sleep(0.5)  # Brief pause between API calls
-        
-        self.analysis_data['migration_steps'] = migration_steps
-
-    def _generate_category_steps(self, category):
-        """Generate detailed steps for a specific migration category"""
-        category_prompts = {
-            "environment_setup": f"""
-            Based on this .NET project analysis, provide detailed environment setup steps:
-            
-            Project Type: {self.analysis_data.get('code_analysis', {}).get('project_type', 'Unknown')}
-            Current Framework: {self.analysis_data.get('code_analysis', {}).get('framework_version', '.NET Framework')}
-            
-            Provide step-by-step instructions for:
-            1. Installing required SDKs and tools
-            2. Setting up development environment
-            3. Configuring cloud platform tools
-            4. Installing migration utilities
-            
-            Include exact commands, download links, and version requirements.
-            """,
-            
-            "code_analysis_and_inventory": """
-            Provide detailed steps for analyzing the legacy codebase:
-            1. Using .NET Portability Analyzer - exact steps with screenshots
-            2. Running try-convert tool - command line examples
-            3. Dependency analysis tools - which tools to use and how
-            4. Creating migration inventory spreadsheet
-            
-            Include specific commands, tool configurations, and expected outputs.
-            """,
-            
-            "dependency_migration": f"""
-            Based on the analyzed dependencies, provide detailed migration steps:
-            
-            Dependencies found: {self.analysis_data.get('code_analysis', {}).get('dependencies', [])}
-            
-            For each dependency provide:
-            1. Exact NuGet commands to remove old packages
-            2. Exact commands to install new packages
-            3. Code changes required
-            4. Testing steps to verify migration
-            
-            Include version compatibility matrices and breaking changes.
-            """,
-            
-            "configuration_migration": """
-            Provide step-by-step configuration migration:
-            1. Converting web.config/app.config to appsettings.json
-            2. Migrating connection strings
-            3. Setting up dependency injection
-            4. Environment-specific configurations
-            
-            Include before/after code examples and exact transformation steps.
-            """,
-            
-            "database_migration": """
-            Provide database migration strategy:
-            1. Assessing current database compatibility
-            2. Planning migration approach (lift-and-shift vs modernization)
-            3. Data migration tools and steps
-            4. Connection string updates
-            5. Cloud database configuration
-            
-            Include specific Azure SQL/AWS RDS setup steps.
-            """,
-            
-            "testing_strategy": """
-            Provide comprehensive testing approach:
-            1. Setting up automated testing framework
-            2. Creating migration test cases
-            3. Performance testing strategy
-            4. Security testing requirements
-            5. User acceptance testing plan
-            
-            Include test framework setup commands and sample test cases.
-            """,
-            
-            "deployment_preparation": """
-            Provide cloud deployment preparation steps:
-            1. Containerization with Docker
-            2. CI/CD pipeline setup
-            3. Infrastructure as Code templates
-            4. Monitoring and logging configuration
-            5. Security configuration
-            
-            Include exact Azure DevOps/GitHub Actions configurations.
-            """,
-            
-            "post_migration_tasks": """
-            Provide post-migration checklist:
-            1. Performance optimization steps
-            2. Security hardening
-            3. Monitoring setup validation
-            4. Documentation updates
-            5. Team training requirements
-            
-            Include verification scripts and monitoring dashboards setup.
-            """
+    def _category_steps(self, category, content):
+        """Wrap the generated content for a migration category"""
+        return {
+            'category': category.replace('_', ' ').title(),
+            'content': content,
+            'generated_at': datetime.now().isoformat()
         }
-        
-        prompt = category_prompts.get(category, f"Provide detailed steps for {category} migration.")
-        
-        try:
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a senior .NET migration specialist. Provide detailed, actionable steps with exact commands and configurations."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500,
-                temperature=0.2
-            )
-            
-            return {
-                'category': category.replace('_', ' ').title(),
-                'content': response.choices[0].message.content,
-                'generated_at': datetime.now().isoformat()
-            }
-        except Exception as e:
-            return {
-                'category': category.replace('_', ' ').title(),
-                'content': f"Error generating steps: {str(e)}",
-                'generated_at': datetime.now().isoformat()
-            }
 
     def generate_final_report(self):
         """Generate and save the final comprehensive report"""
@@ -495,83 +748,271 @@ class DotNetMigrationAnalyzer:
             'analysis_data': self.analysis_data
         }
         
-        # Save detailed JSON report
+        # Save detailed JSON report, compact; /report/<id>?pretty=1 indents it for humans
         report_path = os.path.join(app.config['REPORTS_FOLDER'], f'{self.report_id}.json')
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, separators=(',', ':'), ensure_ascii=False)
         
         # Generate HTML report
         self._generate_html_report(report)
 
     def _generate_html_report(self, report):
         """Generate HTML report from analysis data"""
-        html_template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>.NET Migration Analysis Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
-                .header { background: #2196F3; color: white; padding: 20px; margin: -40px -40px 40px -40px; }
-                .section { margin: 30px 0; padding: 20px; border-left: 4px solid #2196F3; background: #f9f9f9; }
-                .step-item { background: white; margin: 10px 0; padding: 15px; border-radius: 5px; }
-                pre { background: #f4f4f4; padding: 15px; overflow-x: auto; }
-                .progress { background: #e0e0e0; height: 20px; border-radius: 10px; }
-                .progress-bar { background: #4CAF50; height: 100%; border-radius: 10px; width: 100%; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>.NET Legacy Migration Analysis Report</h1>
-                <p>Generated: {{ generated_at }}</p>
-                <div class="progress"><div class="progress-bar"></div></div>
-                <p>Analysis Complete</p>
-            </div>
-            
-            <div class="section">
-                <h2>Executive Summary</h2>
-                <p>{{ executive_summary }}</p>
-            </div>
-            
-            <div class="section">
-                <h2>Project Structure Analysis</h2>
-                <p><strong>Total Files:</strong> {{ total_files }}</p>
-                <p><strong>Total Folders:</strong> {{ total_folders }}</p>
-                <h3>Files by Type:</h3>
-                <ul>
-                {% for file_type, count in files_by_type.items() %}
-                    <li>{{ file_type|title }}: {{ count }} files</li>
-                {% endfor %}
-                </ul>
-            </div>
-            
-            {% for category, steps in migration_steps.items() %}
-            <div class="section">
-                <h2>{{ steps.category }}</h2>
-                <div class="step-item">
-                    <pre>{{ steps.content }}</pre>
-                </div>
-            </div>
-            {% endfor %}
-        </body>
-        </html>
-        """
-        
-        # This would need Jinja2 template rendering in a full implementation
-        # For now, save as a simple HTML file
+        files_and_folders = self.analysis_data['files_and_folders']
         html_path = os.path.join(app.config['REPORTS_FOLDER'], f'{self.report_id}.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(f"<h1>Migration Report {self.report_id}</h1><pre>{json.dumps(report, indent=2)}</pre>")
+        # Stream the rendered chunks straight to disk, passing only the fields the template uses
+        REPORT_TEMPLATE.stream(
+            generated_at=report['metadata']['generated_at'],
+            executive_summary=self.analysis_data['executive_summary'],
+            total_files=files_and_folders['total_files'],
+            total_folders=files_and_folders['total_folders'],
+            files_by_type={file_type: len(files) for file_type, files in files_and_folders['files_by_type'].items()},
+            migration_steps=self.analysis_data['migration_steps']
+        ).dump(html_path, encoding='utf-8')
+
+# Compiled once at import; autoescaping keeps AI-generated text from injecting markup
+REPORT_TEMPLATE = Environment(autoescape=True).from_string("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>.NET Migration Analysis Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+        .header { background: #2196F3; color: white; padding: 20px; margin: -40px -40px 40px -40px; }
+        .section { margin: 30px 0; padding: 20px; border-left: 4px solid #2196F3; background: #f9f9f9; }
+        .step-item { background: white; margin: 10px 0; padding: 15px; border-radius: 5px; }
+        pre { background: #f4f4f4; padding: 15px; overflow-x: auto; }
+        .progress { background: #e0e0e0; height: 20px; border-radius: 10px; }
+        .progress-bar { background: #4CAF50; height: 100%; border-radius: 10px; width: 100%; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>.NET Legacy Migration Analysis Report</h1>
+        <p>Generated: {{ generated_at }}</p>
+        <div class="progress"><div class="progress-bar"></div></div>
+        <p>Analysis Complete</p>
+    </div>
+
+    <div class="section">
+        <h2>Executive Summary</h2>
+        <p>{{ executive_summary }}</p>
+    </div>
+
+    <div class="section">
+        <h2>Project Structure Analysis</h2>
+        <p><strong>Total Files:</strong> {{ total_files }}</p>
+        <p><strong>Total Folders:</strong> {{ total_folders }}</p>
+        <h3>Files by Type:</h3>
+        <ul>
+        {% for file_type, count in files_by_type.items() %}
+            <li>{{ file_type|title }}: {{ count }} files</li>
+        {% endfor %}
+        </ul>
+    </div>
+
+    {% for category, steps in migration_steps.items() %}
+    <div class="section">
+        <h2>{{ steps.category }}</h2>
+        <div class="step-item">
+            <pre>{{ steps.content }}</pre>
+        </div>
+    </div>
+    {% endfor %}
+</body>
+</html>
+""")
+
+class LRU(OrderedDict):
+    """Thread-safe mapping that keeps only the most recently used maxsize entries"""
+    def __init__(self, maxsize=256):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            evicted = [self.popitem(last=False) for _ in range(max(0, len(self) - self.maxsize))]
+        for evicted_key, evicted_value in evicted:
+            self.evict(evicted_key, evicted_value)
+
+    def evict(self, key, value):
+        """Best-effort removal of the uploaded project behind an evicted analysis"""
+        project_path = value['project_path']
+        try:
+            if os.path.isdir(project_path):
+                shutil.rmtree(project_path)
+            else:
+                os.remove(project_path)
+        except OSError:
+            pass
+
+# Recent analyses, so their uploaded projects can be cleaned up; progress itself lives in status files
+analysis_progress = LRU(maxsize=256)
+
+# Workers start from a clean process rather than forking the multi-threaded server
+POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+
+def _new_executor():
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=POOL_CONTEXT)
+
+# Bounded pool of analyzer processes, so concurrent uploads neither pile up threads nor contend for the GIL
+EXECUTOR = _new_executor()
+_EXECUTOR_LOCK = threading.Lock()
+
+def _submit_analysis(project_path, report_id):
+    """Queue an analysis, replacing the pool once if a worker that died abruptly has broken it"""
+    global EXECUTOR
+    executor = EXECUTOR
+    try:
+        return executor.submit(_run_analyzer, project_path, report_id)
+    except BrokenProcessPool:
+        with _EXECUTOR_LOCK:
+            # Another request may already have replaced it
+            if EXECUTOR is executor:
+                EXECUTOR = _new_executor()
+                executor.shutdown(wait=False)
+        return EXECUTOR.submit(_run_analyzer, project_path, report_id)
 
-# Global dictionary to track analysis progress
-analysis_progress = {}
+def _run_analyzer(project_path, report_id):
+    """Run a full analysis in a worker process; progress is reported through the status file"""
+    if project_path.lower().endswith('.zip'):
+        with zipfile.ZipFile(project_path, 'r') as project:
+            return DotNetMigrationAnalyzer(project, report_id).analyze_project()
+    return DotNetMigrationAnalyzer(project_path, report_id).analyze_project()
+
+INDEX_TEMPLATE_PATH = os.path.join('templates', 'index.html')
+INDEX_BROTLI_PATH = INDEX_TEMPLATE_PATH + '.br'
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    # The page is static, so hand out the Brotli copy made at startup unless it's older than the template
+    # Compare the quality, since `in` also matches an explicit refusal like br;q=0
+    if request.accept_encodings['br'] > 0:
+        try:
+            if os.path.getmtime(INDEX_BROTLI_PATH) >= os.path.getmtime(INDEX_TEMPLATE_PATH):
+                with open(INDEX_BROTLI_PATH, 'rb') as f:
+                    response = app.response_class(f.read(), mimetype='text/html')
+                response.headers['Content-Encoding'] = 'br'
+                response.vary.add('Accept-Encoding')
+                return response
+        except FileNotFoundError:
+            pass
+    
+    response = app.make_response(render_template('index.html'))
+    response.vary.add('Accept-Encoding')
+    return response
+
+def _analyzed_zip_size(zip_path):
+    """Total uncompressed size of the zip members the analyzer will look at, from the central directory alone"""
+    total = 0
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            if not info.is_dir() and not _is_ignored_member(info.filename):
+                total += info.file_size
+                if total > app.config['MAX_UNCOMPRESSED_SIZE']:
+                    break  # Stop early on zip bombs
+    return total
+
+# Client-generated IDs for chunked uploads; they become directory names, so keep them plain
+UPLOAD_ID_RE = re.compile(r'[A-Za-z0-9_-]{1,64}')
+
+def _upload_name(original_filename):
+    """Filesystem-safe name for an uploaded file; client names may contain path separators"""
+    return secure_filename(original_filename) or 'upload'
+
+def _start_analysis(upload_path):
+    """Validate a saved upload, move it into place and queue its analysis; returns the JSON response"""
+    filename = os.path.basename(upload_path)
+    # Generate unique report ID, from the sanitized name only since it becomes part of file paths;
+    # the random suffix keeps same-named uploads in the same second from sharing paths
+    report_id = f"report_{int(time.time())}_{filename.split('.')[0]}_{uuid.uuid4().hex[:8]}"
+    
+    extraction_path = os.path.join(app.config['UPLOAD_FOLDER'], report_id)
+    if filename.lower().endswith('.zip'):
+        # Analyze the archive in place instead of extracting it to disk
+        zip_path = extraction_path + '.zip'
+        shutil.move(upload_path, zip_path)
+        try:
+            uncompressed_size = _analyzed_zip_size(zip_path)
+        except zipfile.BadZipFile:
+            os.remove(zip_path)
+            return jsonify({'error': 'Uploaded file is not a valid ZIP archive'}), 400
+        if uncompressed_size > app.config['MAX_UNCOMPRESSED_SIZE']:
+            os.remove(zip_path)
+            return jsonify({'error': 'ZIP contents exceed the maximum uncompressed size'}), 413
+        project_path = zip_path
+    else:
+        # If single file, create directory and move file
+        os.makedirs(extraction_path, exist_ok=True)
+        shutil.move(upload_path, os.path.join(extraction_path, filename))
+        project_path = extraction_path
+    
+    # Queue the analysis on the process pool; the analyzer writes its status file as it goes
+    _write_status_file(report_id, 0, 'Queued for analysis...')
+    analysis_progress[report_id] = {
+        'project_path': project_path
+    }
+    
+    try:
+        future = _submit_analysis(project_path, report_id)
+    except BrokenProcessPool as e:
+        _write_status_file(report_id, 0, f"Error: {e}")
+        return jsonify({'error': 'Analysis workers are unavailable, please retry'}), 503
+    
+    def record_failure(future):
+        # A worker that died never got to report its own error
+        if future.exception() is not None:
+            _write_status_file(report_id, 0, f"Error: {future.exception()}")
+    
+    future.add_done_callback(record_failure)
+    
+    return jsonify({'report_id': report_id, 'status': 'Analysis started'})
+
+def _remove_stale_chunk_dirs():
+    """Drop the slices of chunked uploads that were abandoned before /upload/complete"""
+    cutoff = time.time() - app.config['CHUNK_UPLOAD_TTL']
+    with os.scandir(app.config['CHUNK_FOLDER']) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            except OSError:
+                pass
+
+def _max_upload_chunks():
+    """Most slices a chunked upload within MAX_CONTENT_LENGTH can need"""
+    return -(-app.config['MAX_CONTENT_LENGTH'] // app.config['UPLOAD_CHUNK_SIZE'])
+
+def _save_request_body(path):
+    """Copy a raw octet-stream request body to path in blocks, without multipart parsing"""
+    with open(path, 'wb') as f:
+        shutil.copyfileobj(request.stream, f, 1024 * 1024)
 
 @app.route('/upload', methods=['POST'])
 def upload_project():
+    # Raw uploads carry the file as the whole body and its name in X-Filename
+    if request.mimetype == 'application/octet-stream':
+        filename = unquote(request.headers.get('X-Filename', ''))
+        if filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        upload_path = os.path.join(app.config['UPLOAD_FOLDER'], _upload_name(filename))
+        _save_request_body(upload_path)
+        return _start_analysis(upload_path)
+    
     if 'project_file' not in request.files:
         return jsonify({'error': 'No file uploaded'}), 400
     
@@ -579,56 +1020,116 @@ def upload_project():
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
     
-    # Generate unique report ID
-    report_id = f"report_{int(time.time())}_{file.filename.split('.')[0]}"
-    
     # Save uploaded file
-    filename = secure_filename(file.filename)
-    upload_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    upload_path = os.path.join(app.config['UPLOAD_FOLDER'], _upload_name(file.filename))
     file.save(upload_path)
     
-    # Extract if it's a zip file
-    extraction_path = os.path.join(app.config['UPLOAD_FOLDER'], report_id)
-    if filename.lower().endswith('.zip'):
-        with zipfile.ZipFile(upload_path, 'r') as zip_ref:
-            zip_ref.extractall(extraction_path)
-        os.remove(upload_path)  # Clean up zip file
-    else:
-        # If single file, create directory and move file
-        os.makedirs(extraction_path, exist_ok=True)
-        shutil.move(upload_path, os.path.join(extraction_path, filename))
+    return _start_analysis(upload_path)
+
+@app.route('/upload/chunk', methods=['POST'])
+def upload_chunk():
+    """Store one slice of a chunked upload; slices may arrive in any order and be retried.
     
-    # Initialize progress tracking
-    analysis_progress[report_id] = {
-        'status': 'Uploaded',
-        'progress': 0,
-        'analyzer': None
-    }
+    The slice is the raw request body; its position comes in the X-Upload-Id,
+    X-Chunk-Index and X-Chunk-Total headers.
+    """
+    upload_id = request.headers.get('X-Upload-Id', '')
+    if not UPLOAD_ID_RE.fullmatch(upload_id) or request.mimetype != 'application/octet-stream':
+        return jsonify({'error': 'Invalid chunk upload'}), 400
+    try:
+        index = int(request.headers['X-Chunk-Index'])
+        total = int(request.headers['X-Chunk-Total'])
+    except (KeyError, ValueError):
+        return jsonify({'error': 'Invalid chunk index'}), 400
+    if not 0 <= index < total:
+        return jsonify({'error': 'Invalid chunk index'}), 400
+    if request.content_length is None:
+        return jsonify({'error': 'Chunk length required'}), 411
     
-    # Start analysis in background thread
-    analyzer = DotNetMigrationAnalyzer(extraction_path, report_id)
-    analysis_progress[report_id]['analyzer'] = analyzer
+    # Bound the whole upload as it arrives, not only once it is complete: slices are capped in
+    # size and count, and the bytes already received count towards MAX_CONTENT_LENGTH
+    if total > _max_upload_chunks() or request.content_length > app.config['UPLOAD_CHUNK_SIZE']:
+        return jsonify({'error': 'Uploaded file is too large'}), 413
     
-    def run_analysis():
-        analyzer.analyze_project()
+    chunk_dir = os.path.join(app.config['CHUNK_FOLDER'], upload_id)
+    part_name = f'{index}.part'
+    if os.path.isdir(chunk_dir):
+        with os.scandir(chunk_dir) as entries:
+            # A retried slice replaces its earlier copy, so that one doesn't count
+            received = sum(entry.stat().st_size for entry in entries
+                           if entry.name.endswith('.part') and entry.name != part_name)
+        if received + request.content_length > app.config['MAX_CONTENT_LENGTH']:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+            return jsonify({'error': 'Uploaded file is too large'}), 413
+    else:
+        # Starting a new upload is a good moment to sweep up abandoned ones
+        _remove_stale_chunk_dirs()
+        os.makedirs(chunk_dir, exist_ok=True)
+    part_path = os.path.join(chunk_dir, part_name)
+    # Save under a temporary name so an interrupted chunk never counts as received
+    _save_request_body(part_path + '.tmp')
+    os.replace(part_path + '.tmp', part_path)
     
-    analysis_thread = threading.Thread(target=run_analysis)
-    analysis_thread.daemon = True
-    analysis_thread.start()
+    return jsonify({'upload_id': upload_id, 'index': index})
+
+@app.route('/upload/complete', methods=['POST'])
+def complete_chunked_upload():
+    """Join the received slices of a chunked upload and start its analysis"""
+    payload = request.get_json(silent=True) or {}
+    upload_id = str(payload.get('upload_id', ''))
+    filename = str(payload.get('filename', ''))
+    total = payload.get('total')
+    if not UPLOAD_ID_RE.fullmatch(upload_id) or not isinstance(total, int) or total < 1:
+        return jsonify({'error': 'Invalid chunked upload'}), 400
+    if filename == '':
+        return jsonify({'error': 'No file selected'}), 400
+    # Same bound as /upload/chunk, before anything is built or checked per slice
+    if total > _max_upload_chunks():
+        return jsonify({'error': 'Uploaded file is too large'}), 413
     
-    return jsonify({'report_id': report_id, 'status': 'Analysis started'})
+    chunk_dir = os.path.join(app.config['CHUNK_FOLDER'], upload_id)
+    part_paths = [os.path.join(chunk_dir, f'{index}.part') for index in range(total)]
+    missing = [index for index, part_path in enumerate(part_paths) if not os.path.exists(part_path)]
+    if missing:
+        # Left in place so the missing slices can still be sent; stale directories are swept later
+        return jsonify({
+            'error': 'Upload incomplete',
+            'missing_count': len(missing),
+            'missing_chunks': missing[:20]
+        }), 400
+    
+    # Each chunk is under MAX_CONTENT_LENGTH on its own, so enforce the limit on the whole file here
+    if sum(os.path.getsize(part_path) for part_path in part_paths) > app.config['MAX_CONTENT_LENGTH']:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        return jsonify({'error': 'Uploaded file is too large'}), 413
+    
+    # Join inside this upload's own directory, in a subfolder so no name can clash with a slice;
+    # a shared path in UPLOAD_FOLDER would let two uploads of the same name overwrite each other
+    joined_dir = os.path.join(chunk_dir, 'joined')
+    os.makedirs(joined_dir, exist_ok=True)
+    upload_path = os.path.join(joined_dir, _upload_name(filename))
+    try:
+        with open(upload_path, 'wb') as out:
+            for part_path in part_paths:
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, out, 1024 * 1024)
+        return _start_analysis(upload_path)
+    finally:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
 
 @app.route('/progress/<report_id>')
 def get_progress(report_id):
-    if report_id not in analysis_progress:
+    # Read from disk so any worker process can answer, not just the one running the analysis
+    try:
+        with open(_status_path(report_id), 'rb') as f:
+            status = json.loads(f.read())
+    except FileNotFoundError:
         return jsonify({'error': 'Report not found'}), 404
     
-    analyzer = analysis_progress[report_id]['analyzer']
-    return jsonify({
-        'progress': analyzer.progress,
-        'status': analyzer.status,
-        'completed': analyzer.progress >= 100
-    })
+    # Pollers send back the ETag, so an unchanged status costs an empty 304
+    response = jsonify(status)
+    response.add_etag()
+    return response.make_conditional(request)
 
 @app.route('/report/<report_id>')
 def get_report(report_id):
@@ -636,10 +1137,18 @@ def get_report(report_id):
     if not os.path.exists(report_path):
         return jsonify({'error': 'Report not ready'}), 404
     
-    with open(report_path, 'r', encoding='utf-8') as f:
-        report = json.load(f)
+    # The stored report is already compact JSON, so serve it as-is unless asked to pretty-print
+    if request.args.get('pretty') != '1':
+        return send_file(os.path.abspath(report_path), mimetype='application/json')
+    
+    if orjson is not None:
+        with open(report_path, 'rb') as f:
+            body = orjson.dumps(orjson.loads(f.read()), option=orjson.OPT_INDENT_2)
+    else:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            body = json.dumps(json.load(f), indent=2, ensure_ascii=False)
     
-    return jsonify(report)
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/report/<report_id>/html')
 def get_html_report(report_id):
@@ -689,6 +1198,10 @@ if __name__ == '__main__':
             transform: translateY(-2px);
             box-shadow: 0 10px 20px rgba(33, 150, 243, 0.1);
         }
+        .upload-area.dragover {
+            border-color: #1976D2;
+            background: #e3f2fd;
+        }
         .btn {
             background: linear-gradient(135deg, #2196F3, #1976D2);
             color: white;
@@ -828,27 +1341,27 @@ if __name__ == '__main__':
             100% { transform: rotate(360deg); }
         }
         .collapsible {
+            margin: 5px 0;
+        }
+        .collapsible > summary {
             cursor: pointer;
             padding: 10px;
             background: #f1f3f4;
-            border: none;
-            text-align: left;
-            width: 100%;
             border-radius: 5px;
-            margin: 5px 0;
             font-weight: bold;
         }
-        .collapsible:hover {
+        .collapsible > summary:hover {
             background: #e8eaed;
         }
         .collapsible-content {
-            display: none;
             padding: 15px;
             background: #fafafa;
             border-radius: 0 0 5px 5px;
         }
-        .collapsible.active + .collapsible-content {
-            display: block;
+        /* Let the browser skip rendering large blocks that are offscreen */
+        pre.cv {
+            content-visibility: auto;
+            contain-intrinsic-size: 0 300px;
         }
     </style>
 </head>
@@ -894,54 +1407,143 @@ if __name__ == '__main__':
         </div>
     </div>
 
+    <template id="resultsTpl">
+        <div class="analysis-grid">
+            <div class="stat-card">
+                <div class="stat-number total-files"></div>
+                <div>Total Files</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number total-folders"></div>
+                <div>Folders</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number source-files"></div>
+                <div>Source Files</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number step-count"></div>
+                <div>Migration Steps</div>
+            </div>
+        </div>
+
+        <div class="section-card">
+            <div class="section-title">📝 Executive Summary</div>
+            <p class="summary"></p>
+        </div>
+    </template>
+
+    <template id="codeAnalysisTpl">
+        <div class="section-card">
+            <div class="section-title">🤖 AI Code Analysis</div>
+            <pre class="code-analysis"></pre>
+        </div>
+    </template>
+
+    <template id="stepsTpl">
+        <div class="section-card">
+            <div class="section-title">🚀 Detailed Migration Steps</div>
+        </div>
+    </template>
+
+    <template id="stepTpl">
+        <details class="collapsible">
+            <summary class="cat"></summary>
+            <div class="collapsible-content">
+                <pre class="content cv"></pre>
+                <small><em>Generated: <span class="ts"></span></em></small>
+            </div>
+        </details>
+    </template>
+
+    <template id="structureTpl">
+        <div class="section-card">
+            <div class="section-title">📁 Project Structure</div>
+            <details class="collapsible">
+                <summary>Files by Type</summary>
+                <div class="collapsible-content">
+                    <pre class="files-by-type cv"></pre>
+                </div>
+            </details>
+        </div>
+    </template>
+
     <script>
+        // Elements the script touches, looked up once
+        const $ = Object.fromEntries(
+            ['fileInput', 'analyzeBtn', 'progressSection', 'statusText', 'progressFill',
+             'resultsSection', 'reportContent', 'fileInfo', 'uploadArea']
+                .map(id => [id, document.getElementById(id)])
+        );
+
         let currentReportId = null;
-        let progressInterval = null;
+        let lastReport = null;  // The report currently on screen
+        let progressTimer = null;
+        let progressAbort = null;
+
+        // Collapse a burst of calls into one, fired `delay` ms after the last
+        function debounce(fn, delay) {
+            let timer = null;
+            return function(...args) {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn.apply(this, args), delay);
+            };
+        }
+
+        // Refuse to buffer and parse a JSON body far bigger than anything this
+        // server sends; reports are read through the streaming splitter instead
+        const MAX_JSON_BODY = 50 * 1024 * 1024;
+
+        async function readJson(response) {
+            const length = +response.headers.get('Content-Length') || 0;
+            if (length > MAX_JSON_BODY) {
+                throw new Error(`Response too large to parse (${(length / (1024*1024)).toFixed(1)} MB)`);
+            }
+            return response.json();
+        }
 
-        document.getElementById('fileInput').addEventListener('change', function(e) {
-            const file = e.target.files[0];
+        const showSelectedFile = debounce(function(file) {
             if (file) {
-                const fileInfo = document.getElementById('fileInfo');
-                fileInfo.innerHTML = `
+                $.fileInfo.innerHTML = `
                     <strong>Selected:</strong> ${file.name}<br>
                     <strong>Size:</strong> ${(file.size / (1024*1024)).toFixed(2)} MB<br>
                     <strong>Type:</strong> ${file.type || 'Unknown'}
                 `;
-                fileInfo.style.display = 'block';
-                document.getElementById('analyzeBtn').disabled = false;
+                $.fileInfo.style.display = 'block';
+                $.analyzeBtn.disabled = false;
             }
+        }, 120);
+
+        $.fileInput.addEventListener('change', function(e) {
+            showSelectedFile(e.target.files[0]);
         });
 
         // Drag and drop functionality
-        const uploadArea = document.getElementById('uploadArea');
-        
-        uploadArea.addEventListener('dragover', (e) => {
+        // dragover fires continuously while hovering; adding a class that is
+        // already there doesn't touch the styles again
+        $.uploadArea.addEventListener('dragover', (e) => {
             e.preventDefault();
-            uploadArea.style.borderColor = '#1976D2';
-            uploadArea.style.backgroundColor = '#e3f2fd';
+            $.uploadArea.classList.add('dragover');
         });
 
-        uploadArea.addEventListener('dragleave', (e) => {
+        $.uploadArea.addEventListener('dragleave', (e) => {
             e.preventDefault();
-            uploadArea.style.borderColor = '#2196F3';
-            uploadArea.style.backgroundColor = '#f8f9ff';
+            $.uploadArea.classList.remove('dragover');
         });
 
-        uploadArea.addEventListener('drop', (e) => {
+        $.uploadArea.addEventListener('drop', (e) => {
             e.preventDefault();
-            uploadArea.style.borderColor = '#2196F3';
-            uploadArea.style.backgroundColor = '#f8f9ff';
+            $.uploadArea.classList.remove('dragover');
             
             const files = e.dataTransfer.files;
             if (files.length > 0) {
-                document.getElementById('fileInput').files = files;
-                document.getElementById('fileInput').dispatchEvent(new Event('change'));
+                $.fileInput.files = files;
+                showSelectedFile(files[0]);
             }
         });
 
         async function startAnalysis() {
-            const fileInput = document.getElementById('fileInput');
-            const file = fileInput.files[0];
+            const file = $.fileInput.files[0];
             
             if (!file) {
                 alert('Please select a file first.');
@@ -949,167 +1551,608 @@ if __name__ == '__main__':
             }
 
             // Show progress section
-            document.getElementById('progressSection').style.display = 'block';
-            document.getElementById('resultsSection').style.display = 'none';
-            document.getElementById('analyzeBtn').disabled = true;
-
-            // Upload file
-            const formData = new FormData();
-            formData.append('project_file', file);
+            $.progressSection.style.display = 'block';
+            $.resultsSection.style.display = 'none';
+            $.analyzeBtn.disabled = true;
 
             try {
-                const response = await fetch('/upload', {
-                    method: 'POST',
-                    body: formData
-                });
-
-                const result = await response.json();
+                const response = await uploadInChunks(file);
+                const result = await readJson(response);
                 
                 if (response.ok) {
                     currentReportId = result.report_id;
+                    lastReport = null;
                     startProgressTracking();
                 } else {
                     showError(result.error || 'Upload failed');
                 }
             } catch (error) {
-                showError('Network error: ' + error.message);
+                // fetch rejects with a TypeError when the request never got through
+                showError(error instanceof TypeError ? 'Network error: ' + error.message : error.message);
+            }
+        }
+
+        // Poll with backoff: the delay grows 1.5x while progress is unchanged
+        // (capped at 10s) and drops back to 1s as soon as it moves.
+        const POLL_MIN_DELAY = 1000;
+        const POLL_MAX_DELAY = 10000;
+
+        // Uploads go up in 8MB slices, a few at a time, so only those slices are
+        // held in flight and a failed slice is retried on its own
+        const UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024;  // UPLOAD_CHUNK_SIZE on the server
+        const MAX_UPLOAD_SIZE = 100 * 1024 * 1024;  // MAX_CONTENT_LENGTH on the server
+        const UPLOAD_CONCURRENCY = 3;
+        const UPLOAD_CHUNK_ATTEMPTS = 3;
+
+        function newUploadId() {
+            if (window.crypto && crypto.randomUUID) {
+                return crypto.randomUUID();
             }
+            return Date.now().toString(36) + '-' + Math.random().toString(36).slice(2);
+        }
+
+        async function uploadChunk(uploadId, file, index, total) {
+            const start = index * UPLOAD_CHUNK_SIZE;
+            // Each slice goes up as the raw body, so there's no multipart encoding on either side
+            const body = file.slice(start, start + UPLOAD_CHUNK_SIZE);
+            const headers = {
+                'Content-Type': 'application/octet-stream',
+                'X-Upload-Id': uploadId,
+                'X-Chunk-Index': String(index),
+                'X-Chunk-Total': String(total)
+            };
+            for (let attempt = 1; ; attempt++) {
+                let response;
+                try {
+                    response = await fetch('/upload/chunk', { method: 'POST', headers, body });
+                } catch (error) {
+                    if (attempt >= UPLOAD_CHUNK_ATTEMPTS) {
+                        throw error;
+                    }
+                    continue;
+                }
+                if (response.ok) {
+                    return;
+                }
+                if (response.status < 500 || attempt >= UPLOAD_CHUNK_ATTEMPTS) {
+                    const result = await readJson(response).catch(() => ({}));
+                    throw new Error(result.error || `Chunk ${index + 1} of ${total} failed`);
+                }
+            }
+        }
+
+        async function uploadInChunks(file) {
+            if (file.size > MAX_UPLOAD_SIZE) {
+                throw new Error(`File is too large (${(file.size / (1024*1024)).toFixed(1)} MB, limit ${MAX_UPLOAD_SIZE / (1024*1024)} MB)`);
+            }
+            const uploadId = newUploadId();
+            const total = Math.max(1, Math.ceil(file.size / UPLOAD_CHUNK_SIZE));
+            let next = 0;
+            let sent = 0;
+
+            updateProgress(0, 'Uploading project...');
+
+            async function sendChunks() {
+                while (next < total) {
+                    const index = next++;
+                    await uploadChunk(uploadId, file, index, total);
+                    sent++;
+                    updateProgress(sent / total * 100, `Uploading project... (${sent}/${total} chunks)`);
+                }
+            }
+
+            const workers = [];
+            for (let i = 0; i < Math.min(UPLOAD_CONCURRENCY, total); i++) {
+                workers.push(sendChunks());
+            }
+            await Promise.all(workers);
+
+            return fetch('/upload/complete', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ upload_id: uploadId, filename: file.name, total })
+            });
         }
 
         function startProgressTracking() {
-            progressInterval = setInterval(async () => {
+            let delay = POLL_MIN_DELAY;
+            let lastProgress = null;
+            let etag = null;
+            progressAbort = new AbortController();
+            const signal = progressAbort.signal;
+
+            async function poll() {
                 try {
-                    const response = await fetch(`/progress/${currentReportId}`);
-                    const progress = await response.json();
+                    // Revalidate by hand, so an unchanged status comes back as an empty 304
+                    const response = await fetch(`/progress/${currentReportId}`, {
+                        signal,
+                        cache: 'no-store',
+                        headers: etag ? { 'If-None-Match': etag } : {}
+                    });
+
+                    if (response.status === 304) {
+                        delay = Math.min(delay * 1.5, POLL_MAX_DELAY);
+                    } else {
+                        etag = response.headers.get('ETag');
+                        const progress = await readJson(response);
 
-                    updateProgress(progress.progress, progress.status);
+                        updateProgress(progress.progress, progress.status);
 
-                    if (progress.completed) {
-                        clearInterval(progressInterval);
-                        loadResults();
+                        if (progress.completed) {
+                            stopProgressTracking();
+                            loadResults();
+                            return;
+                        }
+                        if (progress.progress === lastProgress) {
+                            delay = Math.min(delay * 1.5, POLL_MAX_DELAY);
+                        } else {
+                            delay = POLL_MIN_DELAY;
+                        }
+                        lastProgress = progress.progress;
                     }
                 } catch (error) {
+                    if (signal.aborted) {
+                        return;
+                    }
                     console.error('Progress tracking error:', error);
                 }
-            }, 2000);
+                schedulePoll(delay);
+            }
+
+            function schedulePoll(ms) {
+                if (!signal.aborted) {
+                    progressTimer = setTimeout(poll, ms);
+                }
+            }
+
+            schedulePoll(delay);
+        }
+
+        function stopProgressTracking() {
+            clearTimeout(progressTimer);
+            progressTimer = null;
+            if (progressAbort) {
+                progressAbort.abort();
+                progressAbort = null;
+            }
         }
 
         function updateProgress(percentage, status) {
-            const progressFill = document.getElementById('progressFill');
-            const statusText = document.getElementById('statusText');
-            
-            progressFill.style.width = percentage + '%';
-            progressFill.textContent = Math.round(percentage) + '%';
-            statusText.textContent = status;
-            statusText.className = 'status-text';
+            $.progressFill.style.width = percentage + '%';
+            $.progressFill.textContent = Math.round(percentage) + '%';
+            $.statusText.textContent = status;
+            $.statusText.className = 'status-text';
         }
 
-        async function loadResults() {
+        // The latest finished report is kept in IndexedDB, so downloads and page
+        // reloads don't fetch the same JSON again
+        const REPORT_DB_NAME = 'migration-analyzer';
+        const REPORT_STORE = 'reports';
+        let reportDbPromise = null;
+
+        function openReportDb() {
+            if (!reportDbPromise) {
+                reportDbPromise = new Promise((resolve, reject) => {
+                    const request = indexedDB.open(REPORT_DB_NAME, 1);
+                    request.onupgradeneeded = () => request.result.createObjectStore(REPORT_STORE);
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => reject(request.error);
+                });
+            }
+            return reportDbPromise;
+        }
+
+        async function withReportStore(mode, operation) {
+            const db = await openReportDb();
+            return new Promise((resolve, reject) => {
+                const request = operation(db.transaction(REPORT_STORE, mode).objectStore(REPORT_STORE));
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+
+        async function getCachedReport(reportId) {
             try {
-                const response = await fetch(`/report/${currentReportId}`);
-                const report = await response.json();
+                return await withReportStore('readonly', store => store.get(reportId));
+            } catch (error) {
+                console.warn('Report cache unavailable:', error);
+                return undefined;
+            }
+        }
 
-                if (response.ok) {
-                    displayResults(report);
-                    document.getElementById('resultsSection').style.display = 'block';
-                    updateProgress(100, 'Analysis completed successfully!');
-                    document.getElementById('progressSection').style.display = 'none';
+        async function cacheReport(reportId, report) {
+            try {
+                // Only the last report is ever restored, so drop older ones in the same
+                // transaction rather than letting storage grow with every analysis
+                await withReportStore('readwrite', store => {
+                    store.clear();
+                    return store.put(report, reportId);
+                });
+                localStorage.setItem('lastReportId', reportId);
+            } catch (error) {
+                console.warn('Could not cache report:', error);
+            }
+        }
+
+        // Splits report JSON as it streams in. Each finished member of the root
+        // object, and of analysis_data inside it, goes to onMember(parent, key,
+        // value) as soon as it closes, without waiting for the rest of the body.
+        function createReportSplitter(onMember) {
+            const QUOTE = 34;
+            const BACKSLASH = 92;
+            let buf = '';
+            let pos = 0;
+            let depth = 0;
+            let inString = false;
+            let escaped = false;
+            let inAnalysisData = false;
+            let memberStart = -1;  // -1 while the current text isn't needed
+
+            function emit(parent, end) {
+                const text = buf.slice(memberStart, end);
+                if (text.trim()) {
+                    const member = JSON.parse('{' + text + '}');
+                    const key = Object.keys(member)[0];
+                    onMember(parent, key, member[key]);
+                }
+            }
+
+            function push(chunk) {
+                buf += chunk;
+                for (; pos < buf.length; pos++) {
+                    const code = buf.charCodeAt(pos);
+                    if (inString) {
+                        if (escaped) {
+                            escaped = false;
+                        } else if (code === BACKSLASH) {
+                            escaped = true;
+                        } else if (code === QUOTE) {
+                            inString = false;
+                        }
+                        continue;
+                    }
+
+                    const ch = buf[pos];
+                    if (code === QUOTE) {
+                        inString = true;
+                    } else if (ch === '{' || ch === '[') {
+                        depth++;
+                        if (depth === 1) {
+                            memberStart = pos + 1;
+                        } else if (depth === 2 && ch === '{' && memberStart >= 0
+                                && buf.slice(memberStart, pos).trim().startsWith('"analysis_data"')) {
+                            // Hand out analysis_data member by member instead of whole
+                            inAnalysisData = true;
+                            memberStart = pos + 1;
+                        }
+                    } else if (ch === ',' || ch === '}' || ch === ']') {
+                        if (depth === 2 && inAnalysisData) {
+                            emit('analysis_data', pos);
+                            memberStart = pos + 1;
+                        } else if (depth === 1) {
+                            if (memberStart >= 0) {
+                                emit(null, pos);
+                            }
+                            memberStart = pos + 1;
+                        }
+                        if (ch !== ',') {
+                            if (depth === 2 && inAnalysisData) {
+                                inAnalysisData = false;
+                                memberStart = -1;
+                            }
+                            depth--;
+                        }
+                    }
+                }
+
+                // Only the member still being read has to stay buffered
+                const keep = memberStart >= 0 ? Math.min(memberStart, pos) : pos;
+                buf = buf.slice(keep);
+                pos -= keep;
+                if (memberStart >= 0) {
+                    memberStart -= keep;
+                }
+            }
+
+            return { push };
+        }
+
+        // Read the report body, handing each analysis_data section to the view as
+        // it arrives; returns the whole report for caching
+        async function readReport(response, view) {
+            if (!response.body || !response.body.getReader || !window.TextDecoder) {
+                const report = await readJson(response);
+                for (const key of Object.keys(report.analysis_data || {})) {
+                    view.section(key, report.analysis_data[key]);
+                }
+                return report;
+            }
+
+            const report = { analysis_data: {} };
+            const splitter = createReportSplitter((parent, key, value) => {
+                if (parent === 'analysis_data') {
+                    report.analysis_data[key] = value;
+                    view.section(key, value);
                 } else {
-                    showError('Failed to load report: ' + (report.error || 'Unknown error'));
+                    report[key] = value;
+                }
+            });
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            for (;;) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+                splitter.push(decoder.decode(value, { stream: true }));
+            }
+            splitter.push(decoder.decode());
+            return report;
+        }
+
+        async function loadResults() {
+            try {
+                const cached = await getCachedReport(currentReportId);
+                if (cached) {
+                    showResults(cached);
+                    return;
+                }
+
+                const response = await fetch(`/report/${currentReportId}`);
+                if (!response.ok) {
+                    const result = await readJson(response).catch(() => ({}));
+                    showError('Failed to load report: ' + (result.error || 'Unknown error'));
+                    return;
                 }
+
+                const view = createResultsView();
+                $.resultsSection.style.display = 'block';
+                const report = await readReport(response, view);
+                view.finish();
+                lastReport = report;
+
+                cacheReport(currentReportId, report);
+                finishResults();
             } catch (error) {
                 showError('Failed to load results: ' + error.message);
             }
         }
 
-        function displayResults(report) {
-            const data = report.analysis_data;
-            const content = document.getElementById('reportContent');
-            
-            let html = `
-                <div class="analysis-grid">
-                    <div class="stat-card">
-                        <div class="stat-number">${data.files_and_folders?.total_files || 0}</div>
-                        <div>Total Files</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-number">${data.files_and_folders?.total_folders || 0}</div>
-                        <div>Folders</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-number">${data.files_and_folders?.files_by_type?.source_code?.length || 0}</div>
-                        <div>Source Files</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-number">${Object.keys(data.migration_steps || {}).length}</div>
-                        <div>Migration Steps</div>
-                    </div>
-                </div>
+        function showResults(report) {
+            lastReport = report;
+            displayResults(report);
+            $.resultsSection.style.display = 'block';
+            finishResults();
+        }
 
-                <div class="section-card">
-                    <div class="section-title">📝 Executive Summary</div>
-                    <p>${data.executive_summary || 'Summary not available'}</p>
-                </div>
+        function finishResults() {
+            updateProgress(100, 'Analysis completed successfully!');
+            $.progressSection.style.display = 'none';
+        }
 
-                <div class="section-card">
-                    <div class="section-title">🤖 AI Code Analysis</div>
-                    <pre>${JSON.stringify(data.code_analysis || {}, null, 2)}</pre>
-                </div>
-            `;
+        const resultsTpl = document.getElementById('resultsTpl');
+        const codeAnalysisTpl = document.getElementById('codeAnalysisTpl');
+        const stepsTpl = document.getElementById('stepsTpl');
+        const stepTpl = document.getElementById('stepTpl');
+        const structureTpl = document.getElementById('structureTpl');
 
-            // Add migration steps
-            if (data.migration_steps) {
-                html += '<div class="section-card"><div class="section-title">🚀 Detailed Migration Steps</div>';
-                
-                Object.entries(data.migration_steps).forEach(([key, step]) => {
-                    html += `
-                        <button class="collapsible" onclick="toggleCollapsible(this)">
-                            ${step.category} ▼
-                        </button>
-                        <div class="collapsible-content">
-                            <pre>${step.content}</pre>
-                            <small><em>Generated: ${new Date(step.generated_at).toLocaleString()}</em></small>
-                        </div>
-                    `;
-                });
-                
-                html += '</div>';
+        // Pretty-printing runs in a worker so the rest of the report can paint
+        // while large objects are still being formatted
+        const JSON_WORKER_SOURCE = `
+            self.onmessage = (e) => {
+                self.postMessage({ id: e.data.id, text: JSON.stringify(e.data.obj, null, 2) });
+            };
+        `;
+        const jsonJobs = new Map();
+        let jsonWorker = null;
+        let jsonJobId = 0;
+
+        function getJsonWorker() {
+            if (!jsonWorker) {
+                const blob = new Blob([JSON_WORKER_SOURCE], { type: 'text/javascript' });
+                jsonWorker = new Worker(URL.createObjectURL(blob));
+                jsonWorker.onmessage = (e) => {
+                    const target = jsonJobs.get(e.data.id);
+                    jsonJobs.delete(e.data.id);
+                    if (target) {
+                        target.textContent = e.data.text;
+                    }
+                };
             }
+            return jsonWorker;
+        }
 
-            // Add file structure
-            if (data.files_and_folders) {
-                html += `
-                    <div class="section-card">
-                        <div class="section-title">📁 Project Structure</div>
-                        <button class="collapsible" onclick="toggleCollapsible(this)">
-                            Files by Type ▼
-                        </button>
-                        <div class="collapsible-content">
-                            <pre>${JSON.stringify(data.files_and_folders.files_by_type, null, 2)}</pre>
-                        </div>
-                    </div>
-                `;
+        function prettyPrintInto(target, obj) {
+            const id = ++jsonJobId;
+            target.textContent = 'Formatting…';
+            jsonJobs.set(id, target);
+            getJsonWorker().postMessage({ id, obj });
+        }
+
+        // Building an Intl.DateTimeFormat is expensive, so share one and cache
+        // each formatted timestamp
+        const timestampFormat = new Intl.DateTimeFormat(undefined, { dateStyle: 'medium', timeStyle: 'medium' });
+        const formattedTimestamps = new Map();
+
+        function formatTimestamp(value) {
+            let text = formattedTimestamps.get(value);
+            if (text === undefined) {
+                const date = new Date(value);
+                // format() throws on an invalid date, toString() gives 'Invalid Date'
+                text = isNaN(date) ? date.toString() : timestampFormat.format(date);
+                formattedTimestamps.set(value, text);
+            }
+            return text;
+        }
+
+        // Run render tasks in idle slices, at least one per slice so a
+        // timed-out callback still makes progress
+        const scheduleIdle = window.requestIdleCallback
+            ? (callback) => requestIdleCallback(callback, { timeout: 200 })
+            : (callback) => setTimeout(() => {
+                const start = performance.now();
+                callback({ timeRemaining: () => Math.max(0, 16 - (performance.now() - start)) });
+            }, 1);
+        let renderJob = 0;
+
+        function createIdleQueue() {
+            const job = ++renderJob;
+            const tasks = [];
+            let next = 0;
+            let scheduled = false;
+
+            function work(deadline) {
+                scheduled = false;
+                if (job !== renderJob) {
+                    return;  // A newer report replaced this one
+                }
+                do {
+                    tasks[next++]();
+                } while (next < tasks.length && deadline.timeRemaining() > 2);
+                if (next < tasks.length) {
+                    schedule();
+                }
+            }
+
+            function schedule() {
+                if (!scheduled) {
+                    scheduled = true;
+                    scheduleIdle(work);
+                }
+            }
+
+            return {
+                push(task) {
+                    tasks.push(task);
+                    schedule();
+                }
+            };
+        }
+
+        // Renders analysis_data sections in whatever order they arrive. Everything
+        // is filled in through textContent, so report text is never parsed as
+        // HTML. The stats and summary are written right away, the bulkier
+        // sections are built when the browser is idle, each in its own slot so
+        // the page order stays fixed.
+        function createResultsView() {
+            const content = $.reportContent;
+            const overview = resultsTpl.content.cloneNode(true);
+            const fields = {
+                totalFiles: overview.querySelector('.total-files'),
+                totalFolders: overview.querySelector('.total-folders'),
+                sourceFiles: overview.querySelector('.source-files'),
+                stepCount: overview.querySelector('.step-count'),
+                summary: overview.querySelector('.summary')
+            };
+            fields.totalFiles.textContent = 0;
+            fields.totalFolders.textContent = 0;
+            fields.sourceFiles.textContent = 0;
+            fields.stepCount.textContent = 0;
+
+            const codeSlot = document.createElement('div');
+            const stepsSlot = document.createElement('div');
+            const structureSlot = document.createElement('div');
+            content.replaceChildren(overview, codeSlot, stepsSlot, structureSlot);
+
+            const queue = createIdleQueue();
+            const seen = new Set();
+
+            function renderCodeAnalysis(codeAnalysis) {
+                queue.push(() => {
+                    const node = codeAnalysisTpl.content.cloneNode(true);
+                    prettyPrintInto(node.querySelector('.code-analysis'), codeAnalysis || {});
+                    codeSlot.appendChild(node);
+                });
             }
 
-            content.innerHTML = html;
+            const sections = {
+                files_and_folders(filesAndFolders) {
+                    const ff = filesAndFolders || {};
+                    const types = ff.files_by_type || {};
+                    const sourceFiles = types.source_code || [];
+                    fields.totalFiles.textContent = ff.total_files || 0;
+                    fields.totalFolders.textContent = ff.total_folders || 0;
+                    fields.sourceFiles.textContent = sourceFiles.length;
+
+                    // Add file structure
+                    if (filesAndFolders) {
+                        queue.push(() => {
+                            const structure = structureTpl.content.cloneNode(true);
+                            prettyPrintInto(structure.querySelector('.files-by-type'), ff.files_by_type);
+                            structureSlot.appendChild(structure);
+                        });
+                    }
+                },
+
+                executive_summary(summary) {
+                    fields.summary.textContent = summary || 'Summary not available';
+                },
+
+                migration_steps(migrationSteps) {
+                    const steps = migrationSteps || {};
+                    fields.stepCount.textContent = Object.keys(steps).length;
+
+                    // Add migration steps
+                    if (migrationSteps) {
+                        let card = null;
+                        queue.push(() => {
+                            const node = stepsTpl.content.cloneNode(true);
+                            card = node.querySelector('.section-card');
+                            stepsSlot.appendChild(node);
+                        });
+
+                        for (const key of Object.keys(steps)) {
+                            const step = steps[key];
+                            queue.push(() => {
+                                const node = stepTpl.content.cloneNode(true);
+                                node.querySelector('.cat').textContent = step.category;
+                                node.querySelector('.content').textContent = step.content;
+                                node.querySelector('.ts').textContent = formatTimestamp(step.generated_at);
+                                card.appendChild(node);
+                            });
+                        }
+                    }
+                },
+
+                code_analysis: renderCodeAnalysis
+            };
+
+            return {
+                section(key, value) {
+                    seen.add(key);
+                    if (sections[key]) {
+                        sections[key](value);
+                    }
+                },
+
+                finish() {
+                    if (!seen.has('executive_summary')) {
+                        fields.summary.textContent = 'Summary not available';
+                    }
+                    if (!seen.has('code_analysis')) {
+                        renderCodeAnalysis({});
+                    }
+                }
+            };
         }
 
-        function toggleCollapsible(element) {
-            element.classList.toggle('active');
-            const content = element.nextElementSibling;
-            content.style.display = content.style.display === 'block' ? 'none' : 'block';
+        function displayResults(report) {
+            const data = report.analysis_data;
+            const view = createResultsView();
+            for (const key of Object.keys(data)) {
+                view.section(key, data[key]);
+            }
+            view.finish();
         }
 
         function showError(message) {
-            const statusText = document.getElementById('statusText');
-            statusText.textContent = message;
-            statusText.className = 'status-text error';
+            $.statusText.textContent = message;
+            $.statusText.className = 'status-text error';
             
-            if (progressInterval) {
-                clearInterval(progressInterval);
-            }
+            stopProgressTracking();
             
-            document.getElementById('analyzeBtn').disabled = false;
+            $.analyzeBtn.disabled = false;
         }
 
         function viewReport() {
@@ -1118,27 +2161,66 @@ if __name__ == '__main__':
             }
         }
 
-        function downloadReport() {
+        async function downloadReport() {
             if (currentReportId) {
                 const link = document.createElement('a');
-                link.href = `/report/${currentReportId}`;
                 link.download = `migration_report_${currentReportId}.json`;
-                link.click();
+
+                // Save the copy already in memory, falling back to the cache, then the server
+                const report = lastReport || await getCachedReport(currentReportId);
+                if (report) {
+                    const url = URL.createObjectURL(new Blob([JSON.stringify(report)], { type: 'application/json' }));
+                    link.href = url;
+                    link.click();
+                    // Revoke on the next tick, once the click has started the download
+                    setTimeout(() => URL.revokeObjectURL(url), 0);
+                } else {
+                    link.href = `/report/${currentReportId}`;
+                    link.click();
+                }
             }
         }
 
         // Check for OpenAI API key on load
-        window.addEventListener('load', () => {
+        window.addEventListener('load', async () => {
             // You might want to add a check here for API key availability
             console.log('Migration Analyzer loaded. Make sure OPENAI_API_KEY environment variable is set.');
+
+            // Bring back the last finished report after a reload
+            const lastReportId = localStorage.getItem('lastReportId');
+            if (lastReportId && !currentReportId) {
+                const cached = await getCachedReport(lastReportId);
+                if (cached && !currentReportId) {
+                    currentReportId = lastReportId;
+                    showResults(cached);
+                }
+            }
         });
     </script>
 </body>
 </html>
     '''
     
-    with open('templates/index.html', 'w', encoding='utf-8') as f:
-        f.write(index_html)
+    # Rewrite the template only when its content changed, so debug reloads leave the file alone;
+    # the first line carries a hash of the content it was written from
+    index_marker = f"<!--h:{hashlib.blake2b(index_html.encode('utf-8'), digest_size=8).hexdigest()}-->\n"
+    try:
+        with open(INDEX_TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+            index_current = f.readline() == index_marker
+    except FileNotFoundError:
+        index_current = False
+    if not index_current:
+        tmp_path = f'{INDEX_TEMPLATE_PATH}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(index_marker + index_html)
+        os.replace(tmp_path, INDEX_TEMPLATE_PATH)
+    
+    # Compress once at maximum quality; serving the result costs nothing per request
+    if brotli is not None and not (index_current and os.path.exists(INDEX_BROTLI_PATH)):
+        tmp_path = f'{INDEX_BROTLI_PATH}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(brotli.compress((index_marker + index_html).encode('utf-8'), quality=11))
+        os.replace(tmp_path, INDEX_BROTLI_PATH)
     
     print("Starting .NET Migration Analyzer")
     print("Make sure to set OPENAI_API_KEY environment variable")